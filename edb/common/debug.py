@@ -165,11 +165,11 @@ class flags(metaclass=FlagsMeta):
 
 @contextlib.contextmanager
 def timeit(title='block'):
-    st = time.monotonic()
+    st = time.perf_counter()
     try:
         yield
     finally:
-        print(f'{title} took {time.monotonic() - st:.4f}s')
+        print(f'{title} took {time.perf_counter() - st:.4f}s')
 
 
 def header(*args):
@@ -221,12 +221,13 @@ def print(*args):
 
 def init_debug_flags():
     prefix = 'EDGEDB_DEBUG_'
+    prefix_len = len(prefix)
 
     for env_name, env_val in os.environ.items():
         if not env_name.startswith(prefix):
             continue
 
-        name = env_name[len(prefix):].lower()
+        name = env_name[prefix_len:].lower()
         if not hasattr(flags, name):
             warnings.warn(f'Unknown debug flag: {env_name!r}', stacklevel=2)
             continue
@@ -19,21 +19,30 @@
 
 from __future__ import annotations
 
+import functools
+
 from edb.common.markup.elements import code as code_el
 
-try:
-    from pygments import token, lexers
 
-except ImportError:
-    # No pygments
+# Populated by _import_pygments() on first use, as pygments is
+# expensive to import and most processes never serialize code.
+_TOKEN_MAP: dict = {}
+_FLAT_MAP: dict = {}
 
-    def serialize_code(code, lexer='does not matter'):
-        return code_el.Code(tokens=[code_el.Token(val=code)])
 
-else:
-    import functools
+@functools.lru_cache(None)
+def _import_pygments():
+    """Import pygments and build the token maps.
+
+    Returns the ``pygments.lexers`` module, or ``None`` if pygments
+    is not installed.
+    """
+    try:
+        from pygments import token, lexers
+    except ImportError:
+        return None
 
-    _TOKEN_MAP = {
+    _TOKEN_MAP.update({
         token.Token: code_el.Token,
         token.Whitespace: code_el.Whitespace,
         token.Comment: code_el.Comment,
@@ -55,30 +64,53 @@ else:
         token.String: code_el.String,
         token.Number: code_el.Number,
         token.Error: code_el.Error
-    }
+    })
+
+    # Resolve all standard pygments token types up-front, so that
+    # formatting a token is a single dict lookup.  Non-standard token
+    # types (defined by some lexers) are resolved and added on first use.
+    _FLAT_MAP.update({
+        token_type: _resolve_code_class(token_type)
+        for token_type in token.STANDARD_TYPES
+    })
+
+    return lexers
 
-    @functools.lru_cache(100)
-    def get_code_class(token_type):
+
+def _resolve_code_class(token_type):
+    cls = _TOKEN_MAP.get(token_type)
+    while cls is None and token_type:
+        token_type = token_type[:-1]
         cls = _TOKEN_MAP.get(token_type)
-        while cls is None:
-            token_type = token_type[:-1]
-            cls = _TOKEN_MAP.get(token_type)
 
-        if cls is None:
-            cls = code_el.Token
+    if cls is None:
+        cls = code_el.Token
+
+    return cls
+
 
-        return cls
+def get_code_class(token_type):
+    cls = _FLAT_MAP.get(token_type)
+    if cls is None:
+        _import_pygments()
+        cls = _FLAT_MAP[token_type] = _resolve_code_class(token_type)
+    return cls
 
-    class MarkupFormatter:
-        def format(self, tokens):
-            result = []
 
-            for token_type, value in tokens:
-                cls = get_code_class(token_type)
-                result.append(cls(val=value))
+class MarkupFormatter:
+    def format(self, tokens):
+        lookup = _FLAT_MAP.get
+        return code_el.Code(tokens=[
+            (lookup(token_type) or get_code_class(token_type))(val=value)
+            for token_type, value in tokens
+        ])
 
-            return code_el.Code(tokens=result)
 
-    def serialize_code(code, lexer='python'):
-        lexer = lexers.get_lexer_by_name(lexer, stripall=True)
-        return MarkupFormatter().format(lexer.get_tokens(code))
+def serialize_code(code, lexer='python'):
+    lexers = _import_pygments()
+    if lexers is None:
+        # No pygments
+        return code_el.Code(tokens=[code_el.Token(val=code)])
+
+    lexer = lexers.get_lexer_by_name(lexer, stripall=True)
+    return MarkupFormatter().format(lexer.get_tokens(code))
@@ -80,9 +80,12 @@ def supports_colors(fileno):
     :params int fileno: file-descriptor
     :returns: bool
     """
+    # Check the environment first, as it is cheaper than the isatty()
+    # syscall.
     return (
-        isatty(fileno) and os.getenv('TERM') != 'dumb' and
-        os.getenv('ANSI_COLORS_DISABLED') is None)
+        os.getenv('TERM') != 'dumb' and
+        os.getenv('ANSI_COLORS_DISABLED') is None and
+        isatty(fileno))
 
 
 def size(fileno):
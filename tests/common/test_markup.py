@@ -19,6 +19,7 @@
 
 import collections
 import unittest
+import unittest.mock
 
 from edb.common import markup
 from edb.common.markup.format import xrepr
@@ -166,3 +167,26 @@ class MarkupTests(unittest.TestCase):
         obj = collections.OrderedDict([[1, 2], [2, 3], [3, 4], [5, 6]])
         result = ''.join(markup.dumps(obj).split())
         assert result == '{1:2,2:3,3:4,5:6}'
+
+    def test_utils_markup_serialize_code(self):
+        code = markup.serializer.serialize_code('def foo(): return 42')
+        classes = [type(tok) for tok in code.tokens]
+        assert markup.elements.code.Keyword in classes
+        assert markup.elements.code.FunctionName in classes
+        assert markup.elements.code.Number in classes
+
+    def test_utils_markup_get_code_class_before_serialize(self):
+        from pygments import token
+        from edb.common.markup.serializer import code
+
+        # Simulate the state before the first serialize_code() call,
+        # when pygments has not been imported yet.  Initialize first, so
+        # that the maps are populated again once the patches are undone.
+        code._import_pygments()
+        code._import_pygments.cache_clear()
+        with unittest.mock.patch.dict(code._TOKEN_MAP, clear=True), \
+                unittest.mock.patch.dict(code._FLAT_MAP, clear=True):
+            assert (code.get_code_class(token.Keyword)
+                    is markup.elements.code.Keyword)
+            assert (code.get_code_class(token.Name.Foo)
+                    is markup.elements.code.Name)
@@ -87,3 +87,31 @@ class ProfilingTestCase(unittest.TestCase):
             out_contents = out.read()
             self.assertIn("profiled_function", out_contents)
             self.assertIn("regular_function", out_contents)
+
+    def test_tools_profiling_no_builtins(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            profiler = profiling.profile(
+                dir=tmpdir, prefix="test_", suffix=".ptest", builtins=False
+            )
+
+            @profiler
+            def profiled_function(arg):
+                return regular_function(arg)
+
+            profiled_function(1)
+
+            out_file = pathlib.Path(tmpdir) / "out.pstats"
+            success, failure = profiler.aggregate(
+                out_file, sort_by="cumulative", quiet=True
+            )
+
+            self.assertEqual(success, 1)
+            self.assertEqual(failure, 0)
+
+            with out_file.open() as out:
+                out_contents = out.read()
+                self.assertIn("regular_function", out_contents)
+                self.assertNotIn("builtins.hash", out_contents)
+
+            self.assertTrue(out_file.with_suffix(".call_stack.svg").exists())
+            self.assertTrue(out_file.with_suffix(".usage.svg").exists())